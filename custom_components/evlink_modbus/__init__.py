@@ -1,8 +1,46 @@
-from .const import DOMAIN
+import voluptuous as vol
+
+from homeassistant.core import ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN, SERVICE_PROFILE_POLL, ATTR_CYCLES, DEFAULT_PROFILE_CYCLES
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+PROFILE_POLL_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=100)
+    ),
+})
+
+async def async_setup(hass, config):
+    async def async_profile_poll(call: ServiceCall):
+        profilers = hass.data.get(DOMAIN, {})
+        if not profilers:
+            raise ServiceValidationError("No EVLink Modbus entry is loaded")
+        running = [
+            entry_id for entry_id, profiler in profilers.items()
+            if not profiler.start(call.data[ATTR_CYCLES])
+        ]
+        if running:
+            raise ServiceValidationError(
+                f"Poll profiling already running for entry {', '.join(running)}"
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE_POLL, async_profile_poll, schema=PROFILE_POLL_SCHEMA
+    )
+    return True
 
 async def async_setup_entry(hass, entry):
     await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
     return True
 
 async def async_unload_entry(hass, config_entry):
-    return await hass.config_entries.async_forward_entry_unload(config_entry, "sensor")
\ No newline at end of file
+    unloaded = await hass.config_entries.async_forward_entry_unload(config_entry, "sensor")
+    if unloaded:
+        profiler = hass.data.get(DOMAIN, {}).pop(config_entry.entry_id, None)
+        if profiler is not None:
+            profiler.stop()
+    return unloaded
\ No newline at end of file
@@ -6,4 +6,8 @@ CONF_SLAVE_ID = "slave_id"
 
 DEFAULT_HOST = "192.168.1.100"
 DEFAULT_PORT = 502
-DEFAULT_SLAVE_ID = 255
\ No newline at end of file
+DEFAULT_SLAVE_ID = 255
+
+SERVICE_PROFILE_POLL = "profile_poll"
+ATTR_CYCLES = "cycles"
+DEFAULT_PROFILE_CYCLES = 5
\ No newline at end of file
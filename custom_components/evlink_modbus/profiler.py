@@ -0,0 +1,307 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import time
+from contextvars import ContextVar
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reihenfolge der Stufen im Bericht
+STAGES = (
+    "encode", "send", "await_reply", "frame", "decode", "sensor_decode", "entity_write",
+)
+
+# Anzahl Funktionen pro Abschnitt im cProfile-Bericht
+REPORT_TOP_N = 40
+
+_COMPONENT_DIR = os.path.dirname(__file__)
+
+# Sammelt encode/send-Zeiten des gerade laufenden Requests (pro Task)
+_current_call = ContextVar("evlink_profiler_call", default=None)
+
+# Summiert die Modbus-Zeit eines Sensor-Updates, der Rest ist Auswertung
+_current_update = ContextVar("evlink_profiler_update", default=None)
+
+
+class PollProfiler:
+    """Profiliert die nächsten N Abfragezyklen und schreibt einen Bericht.
+
+    Die Instrumentierung wird nur für die Dauer der Aufzeichnung auf der
+    Client-Instanz installiert und danach wieder entfernt.
+    """
+
+    def __init__(self, hass, entry_id, client):
+        self._hass = hass
+        self._entry_id = entry_id
+        self._client = client
+        self._remaining = 0
+        self._cycles = 0
+        self._installed = False
+        self._busy = False
+        self._profile = None
+        self._timings = {}
+        self._sensor_timings = {}
+        self._cycle_timings = []
+        self._tids = set()
+        self._started = None
+
+    @property
+    def active(self):
+        return self._remaining > 0
+
+    def start(self, cycles):
+        if self.active:
+            _LOGGER.warning("Poll profiling already running, %s cycles left", self._remaining)
+            return False
+        self._remaining = cycles
+        self._cycles = cycles
+        self._timings = {stage: [] for stage in STAGES}
+        self._sensor_timings = {}
+        self._cycle_timings = []
+        self._started = dt_util.now()
+        _LOGGER.info("Poll profiling started for %s cycles", cycles)
+        return True
+
+    def stop(self):
+        self._remaining = 0
+        self._uninstall()
+        self._disable_profile()
+        self._profile = None
+
+    async def async_profile_cycle(self, sensors):
+        # Ein hängender Zyklus darf nicht vom nächsten Intervall überholt werden
+        if self._busy:
+            _LOGGER.debug("Profiled poll cycle still running, skipping this interval")
+            return
+        self._busy = True
+        try:
+            await self._async_run_cycle(sensors)
+        finally:
+            self._busy = False
+
+        # Während des Zyklus per stop() abgebrochen
+        if not self._installed:
+            return
+
+        self._remaining -= 1
+        if self._remaining > 0:
+            return
+
+        self._uninstall()
+        report = self._build_report()
+        self._profile = None
+        path = self._hass.config.path(
+            f"{DOMAIN}_profile_{self._entry_id}_{self._started:%Y%m%d_%H%M%S}.txt"
+        )
+        await self._hass.async_add_executor_job(_write_report, path, report)
+        _LOGGER.info("Poll profiling finished, report written to %s", path)
+
+    async def _async_run_cycle(self, sensors):
+        self._install()
+        self._enable_profile()
+        cycle_start = time.perf_counter()
+        try:
+            for sensor in sensors:
+                update = {"modbus": 0.0}
+                token = _current_update.set(update)
+                start = time.perf_counter()
+                try:
+                    await sensor.async_update()
+                finally:
+                    elapsed = time.perf_counter() - start
+                    _current_update.reset(token)
+                self._sensor_timings.setdefault(sensor.name, []).append(elapsed)
+                self._timings["sensor_decode"].append(elapsed - update["modbus"])
+
+                # Deaktivierte Entitäten sind nicht an hass gebunden
+                if sensor.hass is None:
+                    continue
+                start = time.perf_counter()
+                sensor.async_write_ha_state()
+                self._timings["entity_write"].append(time.perf_counter() - start)
+        finally:
+            self._disable_profile()
+            self._cycle_timings.append(time.perf_counter() - cycle_start)
+
+    # ------------------------------------------------------------------ #
+    # cProfile
+    # ------------------------------------------------------------------ #
+    def _enable_profile(self):
+        if self._profile is False:
+            return
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+        try:
+            self._profile.enable()
+        except ValueError as e:
+            # Ein anderer Profiler (z.B. die HA-Integration "profiler") ist aktiv
+            _LOGGER.warning("cProfile not available, recording stage timings only: %s", e)
+            self._profile = False
+
+    def _disable_profile(self):
+        if self._profile:
+            self._profile.disable()
+
+    # ------------------------------------------------------------------ #
+    # Instrumentierung
+    # ------------------------------------------------------------------ #
+    def _install(self):
+        if self._installed:
+            return
+        client = self._client
+        framer = client.framer
+        decoder = framer.decoder
+
+        orig_execute = client.async_execute
+        orig_build = framer.buildPacket
+        orig_send = client.send
+        orig_incoming = framer.processIncomingPacket
+        orig_decode = decoder.decode
+        timings = self._timings
+        # Transaktions-IDs der Requests aus profilierten Zyklen, damit
+        # Requests aus dem HA-eigenen Entity-Polling nicht mitgezählt werden
+        tids = self._tids
+        tids.clear()
+        packet = [None]
+
+        async def async_execute(request):
+            if (update := _current_update.get()) is None:
+                return await orig_execute(request)
+            call = {"encode": 0.0, "send": 0.0}
+            token = _current_call.set(call)
+            start = time.perf_counter()
+            try:
+                return await orig_execute(request)
+            finally:
+                elapsed = time.perf_counter() - start
+                _current_call.reset(token)
+                update["modbus"] += elapsed
+                timings["await_reply"].append(elapsed - call["encode"] - call["send"])
+
+        def build_packet(message):
+            start = time.perf_counter()
+            try:
+                return orig_build(message)
+            finally:
+                if _current_call.get() is not None:
+                    tids.add(message.transaction_id)
+                _record_call("encode", time.perf_counter() - start, timings)
+
+        def send(data, addr=None):
+            start = time.perf_counter()
+            try:
+                return orig_send(data, addr)
+            finally:
+                _record_call("send", time.perf_counter() - start, timings)
+
+        # frame = Framing ohne PDU-Decoding, das unter "decode" läuft
+        def process_incoming_packet(data, callback, slave, **kwargs):
+            current = packet[0] = {"decode": 0.0, "profiled": False}
+
+            def handle_response(reply, **cb_kwargs):
+                if reply is not None and reply.transaction_id in tids:
+                    tids.discard(reply.transaction_id)
+                    current["profiled"] = True
+                return callback(reply, **cb_kwargs)
+
+            start = time.perf_counter()
+            try:
+                return orig_incoming(data, handle_response, slave, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                packet[0] = None
+                if current["profiled"]:
+                    timings["frame"].append(elapsed - current["decode"])
+                    timings["decode"].append(current["decode"])
+
+        def decode(message):
+            start = time.perf_counter()
+            try:
+                return orig_decode(message)
+            finally:
+                if packet[0] is not None:
+                    packet[0]["decode"] += time.perf_counter() - start
+
+        client.async_execute = async_execute
+        framer.buildPacket = build_packet
+        client.send = send
+        framer.processIncomingPacket = process_incoming_packet
+        decoder.decode = decode
+
+        self._installed = True
+
+    def _uninstall(self):
+        if not self._installed:
+            return
+        # Instanz-Attribute entfernen, damit wieder die Klassenmethoden greifen
+        for obj, attrs in (
+            (self._client, ("async_execute", "send")),
+            (self._client.framer, ("buildPacket", "processIncomingPacket")),
+            (self._client.framer.decoder, ("decode",)),
+        ):
+            for attr in attrs:
+                obj.__dict__.pop(attr, None)
+        self._tids.clear()
+        self._installed = False
+
+    # ------------------------------------------------------------------ #
+    # Bericht
+    # ------------------------------------------------------------------ #
+    def _build_report(self):
+        out = io.StringIO()
+        out.write(f"EVLink Modbus poll profile, started {self._started:%Y-%m-%d %H:%M:%S}\n")
+        out.write(f"Cycles: {len(self._cycle_timings)} of {self._cycles}\n\n")
+
+        out.write("Cycle timings\n")
+        _write_table(out, {"cycle": self._cycle_timings})
+
+        out.write("\nStage timings\n")
+        _write_table(out, self._timings)
+        out.write(
+            "\nOnly requests from the profiled cycles are counted. encode/send/\n"
+            "await_reply are per request, frame/decode (PDU) per received packet,\n"
+            "sensor_decode is the register conversion and entity_write the state\n"
+            "write per sensor update. await_reply includes waiting for the client\n"
+            "lock while Home Assistant's own entity polling uses the connection.\n"
+        )
+
+        out.write("\nSensor update timings\n")
+        _write_table(out, self._sensor_timings)
+
+        if self._profile:
+            out.write(f"\ncProfile, integration code (top {REPORT_TOP_N} by cumulative time)\n")
+            stats = pstats.Stats(self._profile, stream=out)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(re.escape(_COMPONENT_DIR), REPORT_TOP_N)
+
+            out.write(f"\ncProfile, all code (top {REPORT_TOP_N} by internal time)\n")
+            stats.sort_stats(pstats.SortKey.TIME)
+            stats.print_stats(REPORT_TOP_N)
+
+        return out.getvalue()
+
+
+def _record_call(stage, elapsed, timings):
+    if (call := _current_call.get()) is not None:
+        timings[stage].append(elapsed)
+        call[stage] += elapsed
+
+
+def _write_table(out, timings):
+    out.write(f"{'name':<32}{'count':>8}{'total ms':>12}{'mean ms':>12}{'max ms':>12}\n")
+    for name, values in timings.items():
+        total = sum(values) * 1000
+        mean = total / len(values) if values else 0.0
+        peak = max(values) * 1000 if values else 0.0
+        out.write(f"{name:<32}{len(values):>8}{total:>12.3f}{mean:>12.3f}{peak:>12.3f}\n")
+
+
+def _write_report(path, report):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(report)
@@ -30,6 +30,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, CONF_HOST, CONF_PORT, CONF_SLAVE_ID
+from .profiler import PollProfiler
 
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.constants import Endian
@@ -138,7 +139,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     async_add_entities(sensors)
 
+    profiler = PollProfiler(hass, entry.entry_id, client)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = profiler
+
     async def async_update_sensors(event_time):
+        if profiler.active:
+            await profiler.async_profile_cycle(sensors)
+            return
         for sensor in sensors:
             await sensor.async_update()
 